@@ -10,6 +10,55 @@
 #              out of money, that player becomes inactive, and cannot move or own spaces. The game continues until all
 #              players, but one, have run out of money. The last player with money is declared the winner.
 
+import random
+
+
+def _step(positions, balances, owners, rents, board_size, go_payout, first_slot, first_space, player_index, roll):
+    """Moves one player in a game stored as flat lists and charges rent for the space they land on. Only uses list
+    indexing and integer arithmetic so it does not depend on the Player or space classes.
+
+    :param positions: list of player positions, one entry per game and player
+    :param balances: list of player account balances, one entry per game and player
+    :param owners: list of space owners as player indexes (-1 if unowned), one entry per game and space
+    :param rents: list of rent amounts for each space on the gameboard (0 for GO)
+    :param board_size: number of total spaces on the gameboard
+    :param go_payout: the amount paid out when a player lands on or passes GO
+    :param first_slot: index of the game's first player in positions and balances
+    :param first_space: index of the game's GO space in owners
+    :param player_index: index of the moving player within the game
+    :param roll: number of spaces to move the player
+
+    :return: player's new position. If the player could not pay the rent, their balance is set to zero and they are
+        removed as the owner of their spaces.
+    """
+    slot = first_slot + player_index
+    balance = balances[slot]
+    new_position = positions[slot] + roll
+
+    # If player passed GO, add payout to account balance
+    if new_position >= board_size:
+        new_position -= board_size
+        balance += go_payout
+    positions[slot] = new_position
+
+    # Deduct property space rent from player's account if owned by another player
+    owner = owners[first_space + new_position]
+    if new_position != 0 and owner != -1 and owner != player_index:
+        rent = rents[new_position]
+        if balance <= rent:
+            balances[first_slot + owner] += balance
+            balance = 0
+            for space_slot in range(first_space, first_space + board_size):
+                if owners[space_slot] == player_index:
+                    owners[space_slot] = -1
+        else:
+            balances[first_slot + owner] += rent
+            balance -= rent
+    balances[slot] = balance
+
+    return new_position
+
+
 class RealEstateGame:
     """
     Represents the game as played.
@@ -17,6 +66,13 @@ class RealEstateGame:
     def __init__(self):
         self._gameboard = []
         self._players = {}
+        self._active_players = set()
+        self._last_name = None
+        self._last_player = None
+        self._board_size = 0
+        self._go_payout = 0
+        self._next_position = []
+        self._passed_go = []
 
     def create_spaces(self, go_payout, rent_amounts):
         """Initialize the gameboard with a GO space followed by property spaces. Must be exactly 24 property spaces.
@@ -28,15 +84,24 @@ class RealEstateGame:
         :return: fills self._gameboard with space objects
         """
         # Create and append GO space to gamebaord
-        go_space = GoSpace("GO", go_payout)
+        go_space = GoSpace(go_payout)
         self._gameboard.append(go_space)
 
         # For the first 24 amounts in the list, create property space and append it to gameboard
         for index in range(24):
             rent = rent_amounts[index]
-            property_space = PropertySpace("Property", rent)
+            property_space = PropertySpace(rent)
             self._gameboard.append(property_space)
 
+        # Store board size and GO payout since they do not change once the board is created
+        self._board_size = len(self._gameboard)
+        self._go_payout = go_payout
+
+        # Precompute the new position and whether GO was passed for every position and die roll (index 0 is unused)
+        board_size = self._board_size
+        self._next_position = [[(position + roll) % board_size for roll in range(7)] for position in range(board_size)]
+        self._passed_go = [[position + roll >= board_size for roll in range(7)] for position in range(board_size)]
+
     def create_player(self, name, account_balance):
         """Create a player object to represent a player in the game. Starting account balance must be greater than 0.
 
@@ -52,50 +117,87 @@ class RealEstateGame:
         # Create player object and add it to player's dictionary
         player_obj = Player(name, account_balance)
         self._players[name] = player_obj
+        self._active_players.add(name)
+
+        # Clear the last looked up player in case it was replaced
+        self._last_name = None
+        self._last_player = None
+
+    def _resolve(self, player_name):
+        """Takes a player's name as a parameter and returns the player object. The last player found is remembered so
+        repeated calls for the same player during a turn skip the dictionary lookup.
+
+        :param player_name: name of the player
+
+        :return: player object, or None if there is no player with that name
+        """
+        if player_name is self._last_name:
+            return self._last_player
+
+        player = self._players.get(player_name)
+        if player is not None:
+            self._last_name = player_name
+            self._last_player = player
+        return player
 
     def get_player_account_balance(self, player_name):
         """Takes a player's name as a parameter and returns the player's account balance.
 
         :param player_name: name of the player
 
-        :return: player's current account balance
+        :return: player's current account balance, or None if there is no player with that name
         """
-        balance = self._players[player_name].get_account_balance()
-        return balance
+        player = self._resolve(player_name)
+        if player is None:
+            return
+        return player.get_account_balance()
 
     def get_player_current_position(self, player_name):
         """Takes a player's name as a parameter and returns their current position.
 
         :param player_name: name of the player
 
-        :return: player's current position
+        :return: player's current position, or None if there is no player with that name
         """
-        current_position = self._players[player_name].get_position()
-        return current_position
+        player = self._resolve(player_name)
+        if player is None:
+            return
+        return player.get_position()
 
     def buy_space(self, player_name):
         """Takes a player's name as a parameter. If the player has enough funds then, the purchase price is deducted from
         the player's account, the player is set as the owner of the current space, and the method returns True.
-        Otherwise, the method returns false.
+        Otherwise, the method returns false. The player's balance must be greater than the purchase price, since a
+        player with a balance of zero is out of the game.
 
         :param player_name: name of the player
 
         :return: True if successful in property purchase
-        :return: False if player has insufficent funds in account balance or property is already owned
+        :return: False if player does not exist, player is on GO, property is already owned or player has insufficent
+            funds in account balance
         """
-        space = self._gameboard[self._players[player_name].get_position()]
-
-        if space.get_space_type() != "GO" and space.get_owner() is None:
-            account_balance = self.get_player_account_balance(player_name)
-            buy_price = space.get_buy_price()
-            player = self._players[player_name]
-            if account_balance > buy_price:
-                # Set player as owner of property space
-                space.new_owner(player)
-                # Subract buy price from player's account
-                player.sub_account_balance(buy_price)
-                return True
-        return False
+        player = self._resolve(player_name)
+        if player is None:
+            return False
+        position = player._position
+
+        # GO is always the first space on the gameboard and cannot be purchased
+        if position == 0:
+            return False
+
+        space = self._gameboard[position]
+        if space._owner is not None:
+            return False
+
+        buy_price = space._buy_price
+        if player._account_balance <= buy_price:
+            return False
+
+        # Set player as owner of property space
+        space.new_owner(player)
+        # Subract buy price from player's account, balance was checked above
+        player._sub_unchecked(buy_price)
+        return True
 
     def move_player(self, player_name, number_of_spaces):
         """Takes a player's name and the number of spaces to move as parameters. Moves player the appropriate amount of
@@ -105,42 +207,97 @@ class RealEstateGame:
         :param player_name: name of player
         :param number_of_spaces: number of spaces player will move on gameboard
 
-        :return: None if player is out of game or if number_of_spaces is outside specified range
+        :return: None if player does not exist, player is out of game or if number_of_spaces is outside specified range
         """
-        player = self._players[player_name]
-
-        # Player is no longer in the game.
-        if player.get_account_balance() == 0:
+        # Number_of_spaces to move is outside the designated range, checked first since it needs no lookup
+        if not 1 <= number_of_spaces <= 6:
             return
 
-        # Number_of_spaces to move is outside the designated range
-        if number_of_spaces < 1 or number_of_spaces > 6:
+        player = self._resolve(player_name)
+
+        # Player does not exist or is no longer in the game.
+        if player is None or player._account_balance == 0:
             return
 
-        old_position = player.get_position()
-        player.move_player(number_of_spaces, len(self._gameboard))
-        new_position = player.get_position()
+        old_position = player._position
+        new_position = self._next_position[old_position][number_of_spaces]
+        player._position = new_position
 
         # If player passed GO, add payout to account balance
-        if new_position < old_position:
-            go_payout = self._gameboard[0].get_payout_amount()
-            player.add_account_balance(go_payout)
+        if self._passed_go[old_position][number_of_spaces]:
+            player._account_balance += self._go_payout
 
-        # If player lands on GO space do not check space rent or ownership
-        if self._gameboard[new_position].get_space_type() == "GO":
+        # If player lands on GO space (always the first space) do not check space rent or ownership
+        if new_position == 0:
             return
 
         # Deduct property space rent from player's account if owned by another player
         current_property = self._gameboard[new_position]
-        if current_property.get_owner() != player and current_property.get_owner() is not None:
-            property_owner = current_property.get_owner()
-            property_rent = current_property.get_rent()
-            if player.get_account_balance() < property_rent:
-                property_owner.add_account_balance(player.get_account_balance())
+        property_owner = current_property._owner
+        if property_owner is not None and property_owner is not player:
+            property_rent = current_property._rent
+            account_balance = player._account_balance
+            if account_balance <= property_rent:
+                property_owner._account_balance += account_balance
                 self.remove_player(player)
             else:
-                property_owner.add_account_balance(property_rent)
-                player.sub_account_balance(property_rent)
+                property_owner._account_balance += property_rent
+                player._sub_unchecked(property_rent)
+
+    def play_moves(self, player_name, rolls):
+        """Takes a player's name and an iterable of die rolls as parameters. Moves the player once for each roll, the
+        same as calling move_player with each roll in order, but looks up the player and board tables only once. Rolls
+        outside the range 1-6 are ignored. Stops early if the player runs out of money.
+
+        :param player_name: name of player
+        :param rolls: iterable of numbers of spaces to move the player on the gameboard
+
+        :return: tuple of the player's final position and account balance, or None if player does not exist
+        """
+        player = self._resolve(player_name)
+        if player is None:
+            return
+
+        gameboard = self._gameboard
+        next_position = self._next_position
+        passed_go = self._passed_go
+        go_payout = self._go_payout
+
+        for number_of_spaces in rolls:
+            # Player is no longer in the game.
+            if player._account_balance == 0:
+                break
+
+            # Number_of_spaces to move is outside the designated range
+            if not 1 <= number_of_spaces <= 6:
+                continue
+
+            old_position = player._position
+            new_position = next_position[old_position][number_of_spaces]
+            player._position = new_position
+
+            # If player passed GO, add payout to account balance
+            if passed_go[old_position][number_of_spaces]:
+                player._account_balance += go_payout
+
+            # If player lands on GO space do not check space rent or ownership
+            if new_position == 0:
+                continue
+
+            # Deduct property space rent from player's account if owned by another player
+            current_property = gameboard[new_position]
+            property_owner = current_property._owner
+            if property_owner is not None and property_owner is not player:
+                property_rent = current_property._rent
+                account_balance = player._account_balance
+                if account_balance <= property_rent:
+                    property_owner._account_balance += account_balance
+                    self.remove_player(player)
+                else:
+                    property_owner._account_balance += property_rent
+                    player._sub_unchecked(property_rent)
+
+        return player._position, player._account_balance
 
     def check_game_over(self):
         """The game is over if all players but one have an account balance of zero. If the game is over, the method
@@ -149,16 +306,9 @@ class RealEstateGame:
         :return: Empty string if game is not over
         :return: Name of winning player if game is over
         """
-        # Find and store player's not out in list
-        players_not_out = []
-        for player in self._players:
-            account_balance = self.get_player_account_balance(player)
-            if account_balance != 0:
-                players_not_out.append(player)
-
-        # Return winning player's name if only 1 player in list
-        if len(players_not_out) == 1:
-            return players_not_out[0]
+        # Return winning player's name if only 1 player is still active
+        if len(self._active_players) == 1:
+            return next(iter(self._active_players))
 
         return ""
 
@@ -171,23 +321,111 @@ class RealEstateGame:
         :return: none
         """
         # set the player's account balance to zero
-        player_obj.sub_account_balance(player_obj.get_account_balance())
-
-        # remove the player as owner from any properties
-        for space in self._gameboard:
-            if space.get_space_type() == "Property" and space.get_owner() == player_obj:
-                space.new_owner(None)
+        player_obj._account_balance = 0
+        self._active_players.discard(player_obj.get_name())
+        self._last_name = None
+        self._last_player = None
+
+        # remove the player as owner from any properties they own
+        owned = player_obj._owned
+        for space in owned:
+            space._owner = None
+        owned.clear()
+
+    def simulate_batch(self, num_games, policies, max_turns=1000, seed=None):
+        """Play many independent games on this gameboard with the current players and return the winner of each. Every
+        game starts with all players on GO with their current account balances. Players take turns in the order they
+        were created, rolling a die each turn, and decide whether to buy the space they land on using their policy.
+
+        The state of all games is stored in flat lists (one entry per game and player, or per game and space) so each
+        turn is advanced for every game in one pass without creating any player or space objects.
+
+        :param num_games: number of games to simulate
+        :param policies: dictionary of player name to a function taking (position, account_balance, buy_price) that
+            returns True if the player buys the space. Players without a policy never buy.
+        :param max_turns: maximum number of rounds to play in each game
+        :param seed: optional seed for the die rolls so results can be repeated
+
+        :return: list with the winning player's name for each game, or an empty string if the game was not over
+            after max_turns rounds
+        """
+        rng = random.Random(seed)
+        names = list(self._players)
+        num_players = len(names)
+        board_size = self._board_size
+        go_payout = self._go_payout
+        rents = [0] + [space._rent for space in self._gameboard[1:]]
+        buy_prices = [0] + [space._buy_price for space in self._gameboard[1:]]
+        player_policies = [policies.get(name) for name in names]
+
+        # Flat game state: index [game * num_players + player] and [game * board_size + space]
+        positions = [0] * (num_games * num_players)
+        balances = [self._players[name]._account_balance for name in names] * num_games
+        owners = [-1] * (num_games * board_size)
+        active_counts = [sum(1 for name in names if self._players[name]._account_balance > 0)] * num_games
+        winners = [""] * num_games
+        games_left = [game for game in range(num_games) if active_counts[game] > 1]
+
+        for game in range(num_games):
+            if active_counts[game] == 1:
+                winners[game] = next(name for name in names if self._players[name]._account_balance > 0)
+
+        for _ in range(max_turns):
+            if not games_left:
+                break
+            for player_index in range(num_players):
+                policy = player_policies[player_index]
+                for game in games_left:
+                    slot = game * num_players + player_index
+                    balance = balances[slot]
+
+                    # Player is no longer in this game
+                    if balance == 0:
+                        continue
+
+                    first_slot = game * num_players
+                    first_space = game * board_size
+                    new_position = _step(positions, balances, owners, rents, board_size, go_payout, first_slot,
+                                         first_space, player_index, rng.randint(1, 6))
+
+                    if balances[slot] == 0:
+                        # Player is out of this game
+                        active_counts[game] -= 1
+                        if active_counts[game] == 1:
+                            winner = next(index for index in range(num_players) if balances[first_slot + index] > 0)
+                            winners[game] = names[winner]
+                        continue
+
+                    # Let the player's policy decide whether to buy an unowned property
+                    space_slot = first_space + new_position
+                    if new_position != 0 and owners[space_slot] == -1 and policy is not None:
+                        balance = balances[slot]
+                        buy_price = buy_prices[new_position]
+                        if balance > buy_price and policy(new_position, balance, buy_price):
+                            owners[space_slot] = player_index
+                            balances[slot] = balance - buy_price
+
+            games_left = [game for game in games_left if active_counts[game] > 1]
+
+        return winners
 
 
 class Player:
     """
-    Represents a player object in the game. Getters for account balance, position. Other methods for changing a player's
-    position on the gameboard and changing account balance.
+    Represents a player object in the game. Getters for name, account balance, position. Other methods for changing a
+    player's account balance. A player's position is updated by RealEstateGame.move_player.
     """
+    __slots__ = ('_name', '_account_balance', '_position', '_owned')
+
     def __init__(self, name, account_balance):
         self._name = name
         self._account_balance = account_balance
         self._position = 0
+        self._owned = set()
+
+    def get_name(self):
+        """Returns player's name."""
+        return self._name
 
     def get_account_balance(self):
         """ Returns player's account balance."""
@@ -219,42 +457,28 @@ class Player:
         else:
             self._account_balance -= amount
 
-    def move_player(self, number_of_spaces, board_size):
-        """Moves a player on a circular gameboard by a specified number of spaces.
+    def _sub_unchecked(self, amount):
+        """Subtract a specified amount from a player's account balance without checking for a negative balance. Only
+        used when the caller has already checked the balance is greater than the amount.
 
-        :param number_of_spaces: number of spaces to move player's position
-        :param board_size: number of total spaces on the gameboard
+        :param amount: amount to be subtracted from a player's account balance
 
         :return: none
         """
-        self._position += number_of_spaces
-
-        # Check if player has completed a full circle on the gameboard
-        if self._position >= board_size:
-            self._position = self._position - board_size
+        self._account_balance -= amount
 
 
-class BoardSpace:
+class PropertySpace:
     """
-    Represents a space on the gameboard. BoardSpace objects should only be created through its subclasses PropertySpace
-    and GoSpace. Contains a getter for a space's type.
+    Represents a property space in the game. Property spaces are every space on the gameboard after GO. Getters for
+    rent, buy price and owner. Setters for owner.
     """
-    def __init__(self, space_type):
-        self._space_type = space_type
-
-    def get_space_type(self):
-        """Returns the space's type."""
-        return self._space_type
-
+    __slots__ = ('_rent', '_buy_price', '_owner')
 
-class PropertySpace(BoardSpace):
-    """
-    Represents a property space in the game. PropertySpace subclass of BoardSpace with an additional parameter for rent.
-    Getters for rent, buy price and owner. Setters for owner.
-    """
-    def __init__(self, space_type, rent):
-        super().__init__(space_type)
+    def __init__(self, rent):
         self._rent = rent
+        # buy price is 5x the amount of rent
+        self._buy_price = rent * 5
         self._owner = None
 
     def get_owner(self):
@@ -270,9 +494,7 @@ class PropertySpace(BoardSpace):
 
         :return: property's rent * 5
         """
-        # buy price is 5x the amount of rent
-        buy_price = self._rent * 5
-        return buy_price
+        return self._buy_price
 
     def new_owner(self, player_obj):
         """Set new player to owner of the property.
@@ -281,16 +503,23 @@ class PropertySpace(BoardSpace):
 
         :return: none
         """
+        # Keep the previous and new owners' sets of owned spaces in sync
+        old_owner = self._owner
+        if old_owner is not None:
+            old_owner._owned.discard(self)
         self._owner = player_obj
+        if player_obj is not None:
+            player_obj._owned.add(self)
 
 
-class GoSpace(BoardSpace):
+class GoSpace:
     """
-    Represents a GO space on the gameboard. GoSpace subclass of BoardSpace with an additional parameter for GO space's
-    payout amount. Getters for payout amount.
+    Represents a GO space on the gameboard. The GO space is always the first space on the gameboard. Getters for payout
+    amount.
     """
-    def __init__(self, space_type, payout_amount):
-        super().__init__(space_type)
+    __slots__ = ('_payout_amount',)
+
+    def __init__(self, payout_amount):
         self._payout_amount = payout_amount
 
     def get_payout_amount(self):